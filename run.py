@@ -4,7 +4,6 @@ from confs.development import development_config
 from confs.local import local_config
 from confs.production import production_config
 from src import create_app
-from src.resources.security import ErtisSecurityManager
 
 CONFIG_LOOKUP = {
     'local': local_config,
@@ -25,7 +24,6 @@ def config_settings():
 settings = config_settings()
 
 app = create_app(settings)
-app.security_manager = ErtisSecurityManager(app.db)
 
 app.debug = settings['debug']
 app.secret_key = settings['application_secret']
@@ -8,7 +8,7 @@ def create_app(settings):
     app = Flask(__name__, template_folder="../templates/")
 
     app.db = MongoClient(settings['mongo_connection_string']).get_database(settings['default_database'])
-    app.public_endpoints = ['healtcheck', 'create_token', 'site_map']
+    app.public_endpoints = {'healtcheck', 'create_token', 'site_map'}
 
     if settings['sentry']['active']:
         sentry_sdk.init(settings['sentry']['connection_string'])
@@ -24,6 +24,10 @@ def create_app(settings):
         mail = Mail(app)
         app.mail = mail
 
+    from src.resources.security import ErtisSecurityManager, ErtisUserCache
+    app.security_manager = ErtisSecurityManager(app.db)
+    app.user_cache = ErtisUserCache(maxsize=10000, ttl=min(settings['token_ttl'] * 60, 60))
+
     from src.services import init_services
     init_services(app, settings)
 
@@ -36,4 +40,6 @@ def create_app(settings):
     from src.generics.additions import init_additions
     init_additions(app, settings)
 
+    app.url_map.update()
+
     return app
@@ -5,7 +5,6 @@ from flask import request, Response
 
 from passlib.hash import bcrypt
 
-from src.resources.security import ErtisSecurityManager
 from src.utils.errors import ErtisError
 from src.utils.json_helpers import bson_to_json
 
@@ -47,8 +46,7 @@ def init_api(app, settings):
                 }
             )
 
-        security_manager = ErtisSecurityManager(app.db)
-        user = security_manager.load_user(token, app_secret, verify_token)
+        user = app.security_manager.load_user(token, app_secret, verify_token)
 
         if user_id != str(user['_id']):
             raise ErtisError(
@@ -88,6 +86,7 @@ def init_api(app, settings):
 
         g_service = app.generic_service
         g_service.replace(user, 'users')
+        app.user_cache.evict_user(user['_id'])
 
         user.pop('password')
 
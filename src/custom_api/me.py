@@ -2,7 +2,6 @@ import json
 
 from flask import request, Response
 
-from src.resources.security import ErtisSecurityManager
 from src.utils.errors import ErtisError
 from src.utils.json_helpers import bson_to_json
 
@@ -38,8 +37,7 @@ def init_api(app, settings):
 
         token = auth_header[1]
 
-        security_manager = ErtisSecurityManager(app.db)
-        user = security_manager.load_user(token, settings['application_secret'], settings['verify_token'])
+        user = app.security_manager.load_user(token, settings['application_secret'], settings['verify_token'])
         user.pop('password', None)
 
         return Response(
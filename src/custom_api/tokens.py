@@ -1,30 +1,26 @@
-import json
+import orjson
+from flask import request
 
-from flask import request, Response
-from jsonschema import validate, ValidationError
-
-from src.resources.security import ErtisSecurityManager
+from src.generics.service import compile_validator, validate_resource
 from src.resources.tokens.schema import CREATE_TOKEN_SCHEMA
 from src.resources.tokens.tokens import ErtisTokenService
 from src.utils.errors import ErtisError
+from src.utils.response_helpers import json_response
+
+CREATE_TOKEN_VALIDATOR = compile_validator(CREATE_TOKEN_SCHEMA)
 
 
 def init_api(app, settings):
+    generic_service = app.generic_service
+    security_manager = app.security_manager
+    app_secret = settings['application_secret']
+    verify_token = settings['verify_token']
+    token_ttl = settings['token_ttl']
+
     @app.route('/api/{}/tokens'.format(settings['api_version']), methods=['POST'])
     def create_token():
-        body = json.loads(request.data)
-        try:
-            validate(body, CREATE_TOKEN_SCHEMA)
-        except ValidationError as e:
-            raise ErtisError(
-                err_code="errors.validationError",
-                err_msg=str(e.message),
-                status_code=400,
-                context={
-                    'required': e.schema.get('required', []),
-                    'properties': e.schema.get('properties', {})
-                }
-            )
+        body = orjson.loads(request.data)
+        validate_resource(body, CREATE_TOKEN_VALIDATOR)
 
         credentials = {
             'email': body['email'],
@@ -32,22 +28,22 @@ def init_api(app, settings):
         }
 
         token = ErtisTokenService.craft_token(
-            app.generic_service,
+            generic_service,
             credentials,
-            settings['application_secret'],
-            settings['token_ttl']
+            app_secret,
+            token_ttl
         )
 
         response = {
             'token': token
         }
 
-        return Response(json.dumps(response), mimetype='application/json', status=200)
+        return json_response(orjson.dumps(response), 200)
 
     @app.route('/api/{}/tokens/refresh'.format(settings['api_version']), methods=['POST'])
     def refresh_token():
         try:
-            body = json.loads(request.data)
+            body = orjson.loads(request.data)
         except ValueError as e:
             raise ErtisError(
                 err_code="errors.badRequest",
@@ -66,17 +62,16 @@ def init_api(app, settings):
                 status_code=400
             )
 
-        security_manager = ErtisSecurityManager(app.db)
-        user = security_manager.load_user(token, settings['application_secret'], settings['verify_token'])
+        user = security_manager.load_user(token, app_secret, verify_token)
 
         new_token = ErtisTokenService.refresh_token(
             user,
-            settings['application_secret'],
-            settings['token_ttl'],
+            app_secret,
+            token_ttl,
         )
 
         response = {
             'token': new_token
         }
 
-        return Response(json.dumps(response), mimetype='application/json', status=201)
+        return json_response(orjson.dumps(response), 201)
@@ -1,3 +1,4 @@
+import copy
 import json
 import traceback
 
@@ -9,6 +10,12 @@ from src.utils.json_helpers import bson_to_json
 
 
 def init_additions(app, settings):
+    app_secret = settings['application_secret']
+    verify_token = settings['verify_token']
+    public_endpoints = app.public_endpoints
+    security_manager = app.security_manager
+    user_cache = app.user_cache
+
     @app.before_request
     def before_request_hook():
         if request.routing_exception:
@@ -20,12 +27,18 @@ def init_additions(app, settings):
 
         auth_header = request.headers.get('Authorization', None)
 
-        if request.endpoint not in app.public_endpoints or auth_header:
-            token = ensure_token_provided(auth_header)[1]
+        if auth_header or request.endpoint not in public_endpoints:
+            token = ensure_token_provided(auth_header)
+
+            user = user_cache.get(token)
+            if user is None:
+                decoded = security_manager.decode_token(token, app_secret, verify_token)
+                user = security_manager.load_permissions(security_manager.find_token_user(decoded))
+                user_cache.set(token, user, decoded.get('exp'))
+                user = copy.copy(user)
 
-            user = app.security_manager.load_user(token, settings['application_secret'], settings['verify_token'])
             user['token'] = token
-            user['token_type'] = auth_header[0]
+            user['token_type'] = 'Bearer'
             setattr(request, 'user', user)
 
     if settings.get('error_handler', False):
@@ -64,23 +77,12 @@ def ensure_token_provided(auth_header):
             err_msg="Authorization header is required for using this api<{}>",
             status_code=401
         )
-    try:
-        auth_header = auth_header.split(' ')
-    except Exception as e:
-        ErtisError(
-            err_msg="Invalid authorization header provided.",
-            err_code="errors.authorizationHeaderIsInvalid",
-            status_code=401,
-            context={
-                'message': str(e)
-            }
-        )
-
-    if len(auth_header) != 2:
+    scheme, separator, token = auth_header.partition(' ')
+    if scheme != 'Bearer' or not token or ' ' in token:
         raise ErtisError(
             err_msg="Bearer token usage is invalid",
             err_code="errors.invalidBearerTokenUsage",
             status_code=401
         )
 
-    return auth_header
+    return token
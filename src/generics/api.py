@@ -1,11 +1,14 @@
-import json
 import logging
 
-from flask import request, Response
+import orjson
 
-from src.generics.service import run_read_formatter
+from flask import request
+
+from src.generics.service import run_read_formatter, compile_validator
 from src.utils import query_helpers
 from src.utils.gzip import gzipped
+from src.utils.json_helpers import to_json
+from src.utils.response_helpers import json_response
 
 
 def rename(new_name):
@@ -16,6 +19,105 @@ def rename(new_name):
     return wrapper
 
 
+def query_handler(generic_service, resource_service, resource_name, status, read_formatter=None):
+    def query():
+        where, select, limit, sort, skip = query_helpers.parse(request)
+        user = getattr(request, 'user', None)
+
+        response = resource_service.filter(
+            generic_service, where=where, select=select, user=user,
+            limit=limit, sort=sort, skip=skip, resource_name=resource_name,
+            read_formatter=read_formatter
+        )
+
+        return json_response(response, status)
+
+    return query
+
+
+def read_handler(generic_service, resource_service, resource_name, status, read_formatter=None):
+    def read(resource_id):
+        user = getattr(request, 'user', None)
+
+        response = orjson.loads(resource_service.get(
+            generic_service,
+            _id=resource_id,
+            resource_name=resource_name,
+            user=user
+        ))
+
+        response = run_read_formatter(response, read_formatter)
+
+        return json_response(to_json(response), status)
+
+    return read
+
+
+def create_handler(generic_service, resource_service, resource_name, status, read_formatter=None,
+                   validate_by=None, before_create=None, after_create=None):
+    def create():
+        user = getattr(request, 'user', None)
+        data = request.data
+
+        response = orjson.loads(resource_service.post(
+            generic_service,
+            user=user,
+            data=data,
+            resource_name=resource_name,
+            validate_by=validate_by,
+            before_create=before_create,
+            after_create=after_create
+        ))
+
+        response = run_read_formatter(response, read_formatter)
+        return json_response(to_json(response), status)
+
+    return create
+
+
+def update_handler(generic_service, resource_service, resource_name, status, read_formatter=None,
+                   validate_by=None, before_update=None, after_update=None):
+    def update(resource_id):
+        user = getattr(request, 'user', None)
+        data = request.data
+
+        response = orjson.loads(resource_service.put(
+            generic_service,
+            user=user,
+            resource_id=resource_id,
+            data=data,
+            resource_name=resource_name,
+            validate_by=validate_by,
+            before_update=before_update,
+            after_update=after_update
+        ))
+
+        response = run_read_formatter(response, read_formatter)
+        return json_response(to_json(response), status)
+
+    return update
+
+
+def delete_handler(generic_service, resource_service, resource_name, status,
+                   before_delete=None, after_delete=None):
+    def delete(resource_id):
+        user = getattr(request, 'user', None)
+
+        return json_response(
+            resource_service.delete(
+                generic_service,
+                user=user,
+                resource_id=resource_id,
+                resource_name=resource_name,
+                before_delete=before_delete,
+                after_delete=after_delete
+            ),
+            status
+        )
+
+    return delete
+
+
 class GenericErtisApi(object):
     def __init__(self, app, settings, endpoint_prefix, methods, 
                  resource_name=None, resource_service=None, allow_anonymous=False):
@@ -49,10 +151,11 @@ class GenericErtisApi(object):
         self.settings = settings
         self.current_app = app
         self.endpoint_prefix = endpoint_prefix
-        self.methods = methods
+        self.methods = frozenset(methods)
         self.resource_name = resource_name
         self.resource_service = resource_service
         self.allow_anonymous = allow_anonymous
+        self.urls = self.generate_urls()
 
         self.logger = logging.getLogger('resource.' + self.resource_name + '.logger')
 
@@ -65,6 +168,15 @@ class GenericErtisApi(object):
         'DISTINCT': 200
     }
 
+    ENDPOINTS = (
+        # (method, http method, endpoint suffix, status key, handler factory)
+        ('QUERY', 'POST', '_query', 'QUERY', query_handler),
+        ('GET', 'GET', '_read', 'READ', read_handler),
+        ('POST', 'POST', '_create', 'CREATE', create_handler),
+        ('PUT', 'PUT', '_update', 'UPDATE', update_handler),
+        ('DELETE', 'DELETE', '_delete', 'DELETE', delete_handler)
+    )
+
     def generate_urls(self):
 
         delete_url = get_url = update_url = self.endpoint_prefix + '/<resource_id>'
@@ -82,133 +194,69 @@ class GenericErtisApi(object):
             before_delete=None, after_delete=None,
             read_formatter=None
     ):
-        self.logger.info("Resource initialized on <{}> URL".format(self.generate_urls()))
+        self.logger.info("Resource initialized on <%s> URL", self.urls)
         app = self.current_app
+        resource_name = self.resource_name
+        resource_service = self.resource_service
+        generic_service = app.generic_service
 
         endpoint_determiner = ['_create', '_read', '_update', '_delete', '_query']
 
         if self.allow_anonymous:
             for determiner in endpoint_determiner:
-                app.public_endpoints.append(self.resource_name + determiner)
-
-        get_url, post_url, update_url, delete_url, query_url = self.generate_urls()
-
-        if 'QUERY' in self.methods:
-            @app.route(query_url, methods=['POST'], endpoint=self.resource_name + '_query')
-            @rename(self.resource_name + '_query')
-            @gzipped
-            def query():
-
-                where, select, limit, sort, skip = query_helpers.parse(request)
-                user = getattr(request, 'user', None)
-
-                response = json.loads(self.resource_service.filter(
-                    app.generic_service, where=where, select=select, user=user,
-                    limit=limit, sort=sort, skip=skip, resource_name=self.resource_name
-                ))
-
-                _items = []
-                for item in response['items']:
-                    item = run_read_formatter(item, read_formatter)
-                    _items.append(item)
-
-                response['items'] = _items
-
-                return Response(
-                    json.dumps(response),
-                    mimetype='application/json',
-                    status=self.STATUS_CODE_MAPPING['QUERY']
-                )
-
-        if 'GET' in self.methods:
-            @app.route(get_url, methods=['GET'], endpoint=self.resource_name + '_read')
-            @rename(self.resource_name + '_read')
-            @gzipped
-            def read(resource_id):
-                user = getattr(request, 'user', None)
-
-                response = json.loads(self.resource_service.get(
-                    app.generic_service,
-                    _id=resource_id,
-                    resource_name=self.resource_name,
-                    user=user
-                ))
-
-                response = run_read_formatter(response, read_formatter)
-
-                return Response(
-                    json.dumps(response),
-                    mimetype='application/json',
-                    status=self.STATUS_CODE_MAPPING['READ']
-                )
-
-        if 'POST' in self.methods:
-            @app.route(post_url, methods=['POST'], endpoint=self.resource_name + '_create')
-            @rename(self.resource_name + '_create')
-            @gzipped
-            def create():
-                user = getattr(request, 'user', None)
-                data = request.data
-
-                response = json.loads(self.resource_service.post(
-                    app.generic_service,
-                    user=user,
-                    data=data,
-                    resource_name=self.resource_name,
-                    validate_by=create_validation_schema,
-                    before_create=before_create,
-                    after_create=after_create
-                ))
-
-                response = run_read_formatter(response, read_formatter)
-                return Response(
-                    json.dumps(response),
-                    status=self.STATUS_CODE_MAPPING['CREATE'],
-                    mimetype='application/json'
-                )
-
-        if 'PUT' in self.methods:
-            @app.route(update_url, methods=['PUT'], endpoint=self.resource_name + '_update')
-            @rename(self.resource_name + '_update')
-            @gzipped
-            def update(resource_id):
-
-                user = getattr(request, 'user', None)
-                data = request.data
-                response = json.loads(self.resource_service.put(
-                    app.generic_service,
-                    user=user,
-                    resource_id=resource_id,
-                    data=data,
-                    resource_name=self.resource_name,
-                    validate_by=update_validation_schema,
-                    before_update=before_update,
-                    after_update=after_update
-                ))
-
-                response = run_read_formatter(response, read_formatter)
-                return Response(
-                    json.dumps(response),
-                    mimetype='application/json',
-                    status=self.STATUS_CODE_MAPPING['UPDATE']
-                )
-
-        if 'DELETE' in self.methods:
-            @app.route(delete_url, methods=['DELETE'], endpoint=self.resource_name + '_delete')
-            @rename(self.resource_name + '_delete')
-            @gzipped
-            def delete(resource_id):
-
-                user = getattr(request, 'user', None)
-
-                return Response(
-                    self.resource_service.delete(
-                        app.generic_service,
-                        user=user,
-                        resource_id=resource_id,
-                        resource_name=self.resource_name,
-                        before_delete=before_delete,
-                        after_delete=after_delete
-                    ),
-                    status=self.STATUS_CODE_MAPPING['DELETE']
-                )
+                app.public_endpoints.add(resource_name + determiner)
+
+        get_url, post_url, update_url, delete_url, query_url = self.urls
+
+        urls = {
+            'QUERY': query_url,
+            'GET': get_url,
+            'POST': post_url,
+            'PUT': update_url,
+            'DELETE': delete_url
+        }
+
+        handler_options = {
+            'QUERY': {
+                'read_formatter': read_formatter
+            },
+            'GET': {
+                'read_formatter': read_formatter
+            },
+            'POST': {
+                'read_formatter': read_formatter,
+                'validate_by': compile_validator(create_validation_schema),
+                'before_create': before_create,
+                'after_create': after_create
+            },
+            'PUT': {
+                'read_formatter': read_formatter,
+                'validate_by': compile_validator(update_validation_schema),
+                'before_update': before_update,
+                'after_update': after_update
+            },
+            'DELETE': {
+                'before_delete': before_delete,
+                'after_delete': after_delete
+            }
+        }
+
+        for method, http_method, determiner, status_key, factory in self.ENDPOINTS:
+            if method not in self.methods:
+                continue
+
+            endpoint = resource_name + determiner
+            handler = factory(
+                generic_service,
+                resource_service,
+                resource_name,
+                self.STATUS_CODE_MAPPING[status_key],
+                **handler_options[method]
+            )
+
+            app.add_url_rule(
+                urls[method],
+                endpoint=endpoint,
+                view_func=rename(endpoint)(gzipped(handler)),
+                methods=[http_method]
+            )
@@ -1,13 +1,14 @@
 import copy
 import datetime
-import json
 from pprint import pprint
 
-from jsonschema import validate, ValidationError
+import orjson
+
+from jsonschema import Draft4Validator, ValidationError
 
 from src.generics.repository import ErtisGenericRepository, run_function_pool
 from src.utils.errors import ErtisError
-from src.utils.json_helpers import object_hook, bson_to_json
+from src.utils.json_helpers import object_hook, to_json
 
 
 class ErtisGenericService(ErtisGenericRepository):
@@ -19,7 +20,7 @@ class ErtisGenericService(ErtisGenericRepository):
         where = {'_id': _id}
 
         resource = self.find_one_by_id(where, resource_name)
-        return json.dumps(resource, default=bson_to_json)
+        return to_json(resource)
 
     def post(self, **kwargs):
         user = kwargs.get('user', None)
@@ -29,21 +30,10 @@ class ErtisGenericService(ErtisGenericRepository):
         before_create = kwargs.get('before_create')
         after_create = kwargs.get('after_create')
 
-        resource = object_hook(json.loads(data))
+        resource = object_hook(orjson.loads(data))
 
         if validate_by:
-            try:
-                validate(resource, validate_by)
-            except ValidationError as e:
-                raise ErtisError(
-                    err_code="errors.validationError",
-                    err_msg=str(e.message),
-                    status_code=400,
-                    context={
-                        'required': e.schema.get('required', []),
-                        'properties': e.schema.get('properties', {})
-                    }
-                )
+            validate_resource(resource, validate_by)
 
         if before_create:
             run_function_pool(
@@ -76,7 +66,7 @@ class ErtisGenericService(ErtisGenericRepository):
                 data=data
             )
 
-        return json.dumps(resource, default=bson_to_json)
+        return to_json(resource)
 
     def put(self, **kwargs):
         user = kwargs.get('user', None)
@@ -88,29 +78,18 @@ class ErtisGenericService(ErtisGenericRepository):
         after_update = kwargs.get('after_update', None)
 
         try:
-            data = object_hook(json.loads(data))
+            data = object_hook(orjson.loads(data))
         except Exception as e:
             pprint(str(e))
 
         if validate_by:
-            try:
-                validate(data, validate_by)
-            except ValidationError as e:
-                raise ErtisError(
-                    err_code="errors.validationError",
-                    err_msg=str(e.message),
-                    status_code=400,
-                    context={
-                        'required': e.schema.get('required', []),
-                        'properties': e.schema.get('properties', {})
-                    }
-                )
+            validate_resource(data, validate_by)
 
         where = {
             '_id': _id
         }
 
-        resource = json.loads(json.dumps(self.find_one_by_id(where, resource_name), default=bson_to_json))
+        resource = orjson.loads(to_json(self.find_one_by_id(where, resource_name)))
 
         _resource = copy.deepcopy(resource)
 
@@ -155,7 +134,7 @@ class ErtisGenericService(ErtisGenericRepository):
                 _resource=_resource
             )
 
-        return json.dumps(resource, default=bson_to_json)
+        return to_json(resource)
 
     def delete(self, **kwargs):
         user = kwargs.get('user', None)
@@ -199,18 +178,56 @@ class ErtisGenericService(ErtisGenericRepository):
         sort = kwargs.get('sort', None)
         skip = kwargs.get('skip', 0)
         resource_name = kwargs.get('resource_name')
+        read_formatter = kwargs.get('read_formatter')
 
         if not where:
             where = {}
 
         resources, count = self.query(where, select, limit, sort, skip, collection=resource_name)
 
-        response = {
-            'items': resources,
-            'count': len(resources)
-        }
+        return encode_items(resources, read_formatter)
+
+
+def compile_validator(schema):
+    if not schema:
+        return None
+
+    return Draft4Validator(schema, format_checker=None)
+
+
+def validate_resource(resource, validate_by):
+    if isinstance(validate_by, dict):
+        validate_by = compile_validator(validate_by)
+
+    try:
+        validate_by.validate(resource)
+    except ValidationError as e:
+        raise ErtisError(
+            err_code="errors.validationError",
+            err_msg=str(e.message),
+            status_code=400,
+            context={
+                'required': e.schema.get('required', []),
+                'properties': e.schema.get('properties', {})
+            }
+        )
+
+
+def encode_items(resources, read_formatter=None):
+    chunks = [b'{"items":[']
+
+    for idx, resource in enumerate(resources):
+        if idx:
+            chunks.append(b',')
+
+        if read_formatter:
+            resource = run_read_formatter(orjson.loads(to_json(resource)), read_formatter)
+
+        chunks.append(to_json(resource))
+
+    chunks.append(b'],"count":' + to_json(len(resources)) + b'}')
 
-        return json.dumps(response, default=bson_to_json)
+    return b''.join(chunks)
 
 
 def run_read_formatter(resource, function_pool):
@@ -1,4 +1,9 @@
+import copy
+import threading
+import time
+
 import jwt
+from cachetools import TTLCache
 
 from src.generics.service import ErtisGenericService
 from src.utils.errors import ErtisError
@@ -6,7 +11,7 @@ from src.utils.errors import ErtisError
 
 class ErtisSecurityManager(ErtisGenericService):
 
-    def validate_token(self, token, secret, verify):
+    def decode_token(self, token, secret, verify):
         try:
             decoded = jwt.decode(token, key=secret, algorithms='HS256', verify=verify)
 
@@ -29,6 +34,9 @@ class ErtisSecurityManager(ErtisGenericService):
                 }
             )
 
+        return decoded
+
+    def find_token_user(self, decoded):
         where = {
             '_id': decoded['prn']
         }
@@ -36,9 +44,15 @@ class ErtisSecurityManager(ErtisGenericService):
 
         return user
 
+    def validate_token(self, token, secret, verify):
+        decoded = self.decode_token(token, secret, verify)
+        return self.find_token_user(decoded)
+
     def load_user(self, token, secret, verify):
         user = self.validate_token(token, secret, verify)
+        return self.load_permissions(user)
 
+    def load_permissions(self, user):
         permission = self.find_one_by(
             where={
                 'slug': user['permission_group']
@@ -49,3 +63,42 @@ class ErtisSecurityManager(ErtisGenericService):
         user['permissions'] = permission['permissions']
 
         return user
+
+
+class ErtisUserCache(object):
+    """
+    Thread safe token -> user cache used by the request hook.
+
+    Entries expire after ttl seconds or at the token's exp claim, whichever comes first.
+    Changes to a user's permission group document are only picked up once the entry expires.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self._users = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        with self._lock:
+            entry = self._users.get(token)
+
+            if entry is None:
+                return None
+
+            user, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._users.pop(token, None)
+                return None
+
+        return copy.copy(user)
+
+    def set(self, token, user, expires_at=None):
+        with self._lock:
+            self._users[token] = (user, expires_at)
+
+    def evict_user(self, user_id):
+        user_id = str(user_id)
+        with self._lock:
+            for token in list(self._users.keys()):
+                entry = self._users.get(token)
+                if entry and str(entry[0]['_id']) == user_id:
+                    self._users.pop(token, None)
@@ -1,5 +1,4 @@
 import datetime
-import json
 
 import jwt
 from bson import ObjectId
@@ -7,7 +6,6 @@ from bson import ObjectId
 from src.utils.errors import ErtisError
 from src.generics.service import ErtisGenericService
 from src.utils import temporal_helpers
-from src.utils.json_helpers import bson_to_json
 from passlib.hash import bcrypt
 
 
@@ -56,7 +54,6 @@ class ErtisTokenService(ErtisGenericService):
             'prn': str(user['_id']),
         }
 
-        payload = json.loads(json.dumps(payload, default=bson_to_json))
         token = generate_token(payload, secret, token_ttl)
 
         return token
@@ -1,3 +1,4 @@
+from flask import current_app
 from passlib import hash
 
 from src.utils.errors import ErtisError
@@ -74,3 +75,8 @@ def validate_permission_group_in_user(resource, generic_service):
         )
 
     return resource
+
+
+def evict_cached_user(resource):
+    current_app.user_cache.evict_user(resource['_id'])
+    return resource
@@ -30,8 +30,8 @@ def setup_api(app):
             users.ensure_email_is_unique,
             users.validate_permission_group_in_user,
         ],
-        after_update=[],
+        after_update=[users.evict_cached_user],
         before_delete=[],
-        after_delete=[],
+        after_delete=[users.evict_cached_user],
         read_formatter=[users.delete_critical_fields],
     )
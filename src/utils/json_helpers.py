@@ -1,6 +1,8 @@
 import datetime
 import decimal
 
+import orjson
+
 from bson import ObjectId
 from bson.json_util import default
 
@@ -69,3 +71,6 @@ def parse_boolean(json_dict):
 
     return json_dict
 
+
+def to_json(obj):
+    return orjson.dumps(obj, default=bson_to_json, option=orjson.OPT_PASSTHROUGH_DATETIME)
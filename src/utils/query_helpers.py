@@ -1,6 +1,7 @@
-import json
 import logging
 
+import orjson
+
 from src.utils.errors import ErtisError
 from src.utils.json_helpers import object_hook
 
@@ -19,10 +20,12 @@ def get_limit(request, check_max_limit=True):
         return int(limit)
 
 
-def get_select(request):
+def get_body(request):
     try:
-        _json = json.loads(request.data.decode("utf-8")).get("select", None)
-        return _json
+        body = orjson.loads(request.data)
+        if not isinstance(body, dict):
+            raise ValueError("Body must be a json object")
+        return body
     except Exception as ex:
         logging.error(ex)
         raise ErtisError(
@@ -32,18 +35,16 @@ def get_select(request):
         )
 
 
-def get_where(request):
-    try:
-        _json = json.loads(
-            request.data.decode("utf-8"), object_hook=object_hook).get("where", None)
-        return _json
-    except Exception as ex:
-        logging.error(ex)
-        raise ErtisError(
-            err_code="errors.BadJsonGiven",
-            err_msg="Body Json is Invalid",
-            status_code=400
-        )
+def get_select(request, body=None):
+    if body is None:
+        body = get_body(request)
+    return body.get("select", None)
+
+
+def get_where(request, body=None):
+    if body is None:
+        body = get_body(request)
+    return object_hook(body.get("where", None))
 
 
 def get_sort(request):
@@ -78,8 +79,9 @@ def parse_sort(order_by_str):
 
 
 def parse(request):
-    where = get_where(request)
-    select = get_select(request)
+    body = get_body(request)
+    where = get_where(request, body)
+    select = get_select(request, body)
     limit = get_limit(request)
     sort = get_sort(request)
     skip = get_skip(request)
@@ -0,0 +1,8 @@
+from flask import Response
+from werkzeug.datastructures import Headers
+
+JSON_HEADERS = Headers([('Content-Type', 'application/json')])
+
+
+def json_response(body, status):
+    return Response(body, status=status, headers=JSON_HEADERS.copy())